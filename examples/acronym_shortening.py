@@ -14,8 +14,20 @@ The key insight is that UOT is well-suited for this task because:
 import numpy as np
 import ot
 
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional
+    njit = None
 
-def character_position_cost(source_chars, target_chars):
+# The Numba kernel only beats the NumPy broadcast (by about 10%) from
+# roughly 1000 x 1000 cost entries; below that the broadcast is faster
+_NUMBA_MIN_SIZE = 1_000_000
+
+# Below this entropic regularization plain Sinkhorn converges slowly
+_SMALL_REG = 0.05
+
+
+def character_position_cost(source_chars, target_chars, dtype=np.float64):
     """
     Compute a cost matrix based on character matching.
 
@@ -27,25 +39,72 @@ def character_position_cost(source_chars, target_chars):
         List of characters from the source word/phrase
     target_chars : list
         List of characters from the acronym
+    dtype : numpy dtype, optional
+        Floating point type of the cost matrix (default: np.float64)
 
     Returns
     -------
     np.ndarray
         Cost matrix of shape (len(source_chars), len(target_chars))
     """
-    n_source = len(source_chars)
-    n_target = len(target_chars)
-    cost = np.ones((n_source, n_target))
+    return _code_cost(*_char_code_pair(source_chars, target_chars), dtype)
 
-    for i, s_char in enumerate(source_chars):
-        for j, t_char in enumerate(target_chars):
-            if s_char.upper() == t_char.upper():
-                cost[i, j] = 0
 
-    return cost
+def _code_cost(s, t, dtype):
+    """
+    Character cost matrix of the given dtype from two arrays returned by
+    _char_code_pair.
+    """
+    use_numba = njit is not None and s.dtype == t.dtype == np.uint8
+    if use_numba and s.size * t.size >= _NUMBA_MIN_SIZE:
+        out = np.empty((s.size, t.size), dtype=dtype)
+        _char_cost_numba(s, t, out)
+        return out
+    return (s[:, None] != t[None, :]).astype(dtype)
+
 
+def _char_code_pair(source_chars, target_chars):
+    """
+    Convert two lists of characters to arrays that compare case-insensitively.
 
-def find_acronym_mapping(phrase, acronym, reg=0.1, reg_m=1.0):
+    Both sides get the same encoding: uint8 codes when both are ASCII, and
+    upper-cased string arrays otherwise. Mixing the two encodings would make
+    every comparison unequal.
+    """
+    source_text = "".join(source_chars)
+    target_text = "".join(target_chars)
+    both_ascii = (
+        source_text.isascii()
+        and target_text.isascii()
+        and len(source_text) == len(source_chars)
+        and len(target_text) == len(target_chars)
+    )
+    if both_ascii:
+        return (
+            np.frombuffer(source_text.upper().encode("ascii"), dtype=np.uint8),
+            np.frombuffer(target_text.upper().encode("ascii"), dtype=np.uint8),
+        )
+    return (
+        np.char.upper(np.asarray(source_chars, dtype=str)),
+        np.char.upper(np.asarray(target_chars, dtype=str)),
+    )
+
+
+if njit is not None:
+
+    @njit(parallel=True, cache=True)
+    def _char_cost_numba(s, t, out):
+        """
+        Compiled character cost for long uint8 code arrays, written to out.
+        """
+        for i in prange(s.size):
+            for j in range(t.size):
+                out[i, j] = 0.0 if s[i] == t[j] else 1.0
+
+
+def find_acronym_mapping(
+    phrase, acronym, reg=0.1, reg_m=1.0, dtype=np.float64, fast_path=False
+):
     """
     Use Unbalanced Optimal Transport to find the mapping between a phrase
     and its acronym.
@@ -60,6 +119,15 @@ def find_acronym_mapping(phrase, acronym, reg=0.1, reg_m=1.0):
         Entropy regularization parameter (default: 0.1)
     reg_m : float, optional
         Marginal relaxation parameter for unbalanced OT (default: 1.0)
+    dtype : numpy dtype, optional
+        Floating point type of the marginals, cost and transport plan.
+        float32 is faster but underflows the kernel for small reg
+        (default: np.float64)
+    fast_path : bool, optional
+        If True and the word starters spell the acronym exactly
+        (case-insensitive), skip the solver and return the diagonal plan
+        identity / n. This ignores reg and reg_m, so the plan differs from
+        the Sinkhorn plan returned otherwise (default: False)
 
     Returns
     -------
@@ -71,35 +139,216 @@ def find_acronym_mapping(phrase, acronym, reg=0.1, reg_m=1.0):
         - 'mappings': List of (source_idx, source_char, target_idx, target_char, weight)
     """
     # Extract starting characters of words (typical acronym pattern)
-    words = phrase.split()
-    source_chars = [word[0] for word in words if word]
+    source_chars = _word_starters(phrase)
     target_chars = list(acronym)
 
+    exact = fast_path and (
+        [c.upper() for c in source_chars] == [c.upper() for c in target_chars]
+    )
+    if exact:
+        n = len(source_chars)
+        transport_plan = np.eye(n, dtype=dtype) / max(n, 1)
+    else:
+        a, b, cost = _build_problem(source_chars, target_chars, dtype)
+        transport_plan, _ = _solve(a, b, cost, reg, reg_m)
+
+    return _make_result(phrase, acronym, source_chars, target_chars, transport_plan)
+
+
+def sweep_reg_m(phrase, acronym, reg_m_values, reg=0.1, dtype=np.float64):
+    """
+    Find the mapping between a phrase and its acronym for several values of
+    the marginal relaxation parameter.
+
+    The marginals and the cost matrix do not depend on reg_m, so they are
+    built once and only the solver is run for each value. Each solve is
+    warm-started from the dual potentials of the previous one, which are
+    close when reg_m varies monotonically.
+
+    Parameters
+    ----------
+    phrase : str
+        The full phrase (e.g., "Artificial Intelligence")
+    acronym : str
+        The acronym (e.g., "AI")
+    reg_m_values : list of float
+        Marginal relaxation parameters to solve for
+    reg : float, optional
+        Entropy regularization parameter (default: 0.1)
+    dtype : numpy dtype, optional
+        Floating point type of the marginals, cost and transport plan.
+        float32 is faster but underflows the kernel for small reg
+        (default: np.float64)
+
+    Returns
+    -------
+    list of dict
+        One result dictionary per reg_m value, in the same format as
+        find_acronym_mapping
+    """
+    source_chars = _word_starters(phrase)
+    target_chars = list(acronym)
+    a, b, cost = _build_problem(source_chars, target_chars, dtype)
+
+    results = []
+    warmstart = None
+    for reg_m in reg_m_values:
+        transport_plan, warmstart = _solve(a, b, cost, reg, reg_m, warmstart)
+        results.append(
+            _make_result(phrase, acronym, source_chars, target_chars, transport_plan)
+        )
+
+    return results
+
+
+def find_acronym_mappings(pairs, reg=0.1, reg_m=1.0, dtype=np.float64):
+    """
+    Find the mappings for several (phrase, acronym) pairs with a single
+    Unbalanced Optimal Transport solve.
+
+    The characters of all pairs are laid out in flat code buffers, from
+    which the cost of every pair is built as one diagonal block of a larger
+    cost matrix whose off-diagonal blocks have infinite cost. The Gibbs
+    kernel is zero outside the blocks, so the Sinkhorn scalings of different
+    pairs never interact and each block of the joint transport plan is the
+    plan of the corresponding pair. This replaces one POT call per pair with
+    one call for the batch.
+
+    Parameters
+    ----------
+    pairs : list of tuple
+        List of (phrase, acronym) pairs
+    reg : float, optional
+        Entropy regularization parameter (default: 0.1)
+    reg_m : float, optional
+        Marginal relaxation parameter for unbalanced OT (default: 1.0)
+    dtype : numpy dtype, optional
+        Floating point type of the marginals, cost and transport plan.
+        float32 is faster but underflows the kernel for small reg
+        (default: np.float64)
+
+    Returns
+    -------
+    list of dict
+        One result dictionary per pair, in the same format as
+        find_acronym_mapping
+    """
+    source_lists = [_word_starters(phrase) for phrase, _ in pairs]
+    target_lists = [list(acronym) for _, acronym in pairs]
+
+    # A pair with an empty phrase or acronym has an empty plan. It is left out
+    # of the joint problem, where its all-infinite rows or columns would
+    # stall the solver for every pair.
+    plans = [
+        np.zeros((len(source_chars), len(target_chars)), dtype=dtype)
+        for source_chars, target_chars in zip(source_lists, target_lists)
+    ]
+    active = [k for k, plan in enumerate(plans) if plan.size]
+
+    if active:
+        source_lengths = [len(source_lists[k]) for k in active]
+        target_lengths = [len(target_lists[k]) for k in active]
+
+        # Structure-of-arrays layout: all characters of one side in a single
+        # code buffer, with offsets and the owning pair of every character
+        source_codes, target_codes = _char_code_pair(
+            [c for k in active for c in source_lists[k]],
+            [c for k in active for c in target_lists[k]],
+        )
+        source_offsets = np.cumsum([0] + source_lengths)
+        target_offsets = np.cumsum([0] + target_lengths)
+        source_pair = np.repeat(np.arange(len(active)), source_lengths)
+        target_pair = np.repeat(np.arange(len(active)), target_lengths)
+
+        # Stack the uniform marginals of every pair
+        a = np.concatenate([np.full(n, 1.0 / n, dtype=dtype) for n in source_lengths])
+        b = np.concatenate([np.full(n, 1.0 / n, dtype=dtype) for n in target_lengths])
+
+        # Block-diagonal cost matrix built in one pass over the flat buffers:
+        # pairs are not allowed to exchange mass
+        cost = _code_cost(source_codes, target_codes, dtype)
+        cost[source_pair[:, None] != target_pair[None, :]] = np.inf
+
+        # Solve all pairs at once. POT multiplies the zero off-block plan by
+        # the infinite off-block cost when logging; that 0 * inf is expected.
+        with np.errstate(invalid="ignore"):
+            transport_plan, _ = _solve(a, b, cost, reg, reg_m)
+
+        # Split the joint plan back into per-pair plans
+        for i, k in enumerate(active):
+            plans[k] = transport_plan[
+                source_offsets[i] : source_offsets[i + 1],
+                target_offsets[i] : target_offsets[i + 1],
+            ]
+
+    return [
+        _make_result(phrase, acronym, source_lists[k], target_lists[k], plans[k])
+        for k, (phrase, acronym) in enumerate(pairs)
+    ]
+
+
+def _build_problem(source_chars, target_chars, dtype=np.float64):
+    """
+    Build the marginals and the cost matrix for the word starters of a
+    phrase and the characters of an acronym.
+
+    Returns
+    -------
+    tuple
+        (a, b, cost)
+    """
     # Create uniform distributions
     n_source = len(source_chars)
     n_target = len(target_chars)
 
     # Source distribution (uniform over word-starting characters)
-    a = np.ones(n_source) / n_source
+    a = np.full(n_source, 1.0 / max(n_source, 1), dtype=dtype)
 
     # Target distribution (uniform over acronym characters)
-    b = np.ones(n_target) / n_target
+    b = np.full(n_target, 1.0 / max(n_target, 1), dtype=dtype)
 
     # Compute cost matrix
-    cost = character_position_cost(source_chars, target_chars)
+    cost = character_position_cost(source_chars, target_chars, dtype)
+
+    return a, b, cost
+
+
+def _word_starters(phrase):
+    """
+    First character of every word of a phrase.
+    """
+    # str.split() with no separator never yields empty words
+    return [word[0] for word in phrase.split()]
+
+
+def _solve(a, b, cost, reg, reg_m, warmstart=None):
+    """
+    Solve the entropic unbalanced optimal transport problem.
+
+    Returns the transport plan and the (log u, log v) dual potentials, which
+    can be passed back as warmstart to initialize a nearby problem. Small
+    values of reg use the translation invariant solver, which needs far
+    fewer iterations there than plain Sinkhorn. Neither solver prevents the
+    kernel exp(-cost / reg) from underflowing when reg is very small.
+    """
+    method = "sinkhorn_translation_invariant" if reg < _SMALL_REG else "sinkhorn"
+    transport_plan, log = ot.unbalanced.sinkhorn_unbalanced(
+        a, b, cost, reg, reg_m, method=method, warmstart=warmstart, log=True
+    )
+    return transport_plan, (log["logu"], log["logv"])
 
-    # Solve unbalanced optimal transport
-    transport_plan = ot.unbalanced.sinkhorn_unbalanced(a, b, cost, reg, reg_m)
 
+def _make_result(phrase, acronym, source_chars, target_chars, transport_plan):
+    """
+    Build the result dictionary returned by find_acronym_mapping.
+    """
     # Extract significant mappings
-    mappings = []
     threshold = 0.01  # Minimum weight to consider a mapping significant
-    for i in range(n_source):
-        for j in range(n_target):
-            if transport_plan[i, j] > threshold:
-                mappings.append(
-                    (i, source_chars[i], j, target_chars[j], transport_plan[i, j])
-                )
+    rows, cols = np.nonzero(transport_plan > threshold)
+    mappings = [
+        (i, source_chars[i], j, target_chars[j], transport_plan[i, j])
+        for i, j in zip(rows.tolist(), cols.tolist())
+    ]
 
     return {
         "transport_plan": transport_plan,
@@ -151,11 +400,18 @@ def main():
         ("Random Access Memory", "RAM"),
     ]
 
-    for phrase, acronym in test_cases:
-        result = find_acronym_mapping(phrase, acronym)
+    for result in find_acronym_mappings(test_cases):
         print_mapping(result)
         print("-" * 60)
 
+    # Effect of the marginal relaxation on a single pair
+    print("\nEffect of reg_m on 'Unbalanced Optimal Transport' -> 'UOT':")
+    reg_m_values = [0.1, 0.5, 1.0, 5.0]
+    sweep = sweep_reg_m("Unbalanced Optimal Transport", "UOT", reg_m_values)
+    for reg_m, result in zip(reg_m_values, sweep):
+        print(f"\nreg_m = {reg_m}: total mass = {result['transport_plan'].sum():.4f}")
+        print(result["transport_plan"])
+
 
 if __name__ == "__main__":
     main()
@@ -1,9 +1,14 @@
 """Tests for the acronym shortening example."""
 
+import warnings
+
 import numpy as np
+from examples import acronym_shortening
 from examples.acronym_shortening import (
     character_position_cost,
     find_acronym_mapping,
+    find_acronym_mappings,
+    sweep_reg_m,
 )
 
 
@@ -22,6 +27,9 @@ def test_character_position_cost_matching():
     assert cost[0, 1] == 1
     assert cost[1, 0] == 1
 
+    assert cost.dtype == np.float64
+    assert character_position_cost(source, target, np.float32).dtype == np.float32
+
 
 def test_character_position_cost_case_insensitive():
     """Test that character matching is case-insensitive."""
@@ -33,6 +41,37 @@ def test_character_position_cost_case_insensitive():
     assert cost[1, 1] == 0  # 'B' matches 'b'
 
 
+def test_character_position_cost_mixed_ascii():
+    """Test matching when only one side contains non-ASCII characters."""
+    cost = character_position_cost(["A", "É"], ["a", "E"])
+
+    assert np.array_equal(cost, [[0, 1], [1, 1]])
+
+    cost = character_position_cost(["é", "B"], ["É", "b"])
+
+    assert np.array_equal(cost, [[0, 1], [1, 0]])
+
+
+def test_character_position_cost_long_input():
+    """Test that the compiled path, when available, matches the broadcast."""
+    source = list("ab" * 50)
+    target = list("AB" * 50)
+    i, j = np.indices((100, 100))
+    expected = (i % 2 != j % 2).astype(np.float32)
+
+    min_size = acronym_shortening._NUMBA_MIN_SIZE
+    try:
+        # Lower the threshold so the Numba kernel runs if numba is installed
+        acronym_shortening._NUMBA_MIN_SIZE = 0
+        compiled = character_position_cost(source, target)
+    finally:
+        acronym_shortening._NUMBA_MIN_SIZE = min_size
+    broadcast = character_position_cost(source, target)
+
+    assert np.array_equal(compiled, expected)
+    assert np.array_equal(broadcast, expected)
+
+
 def test_find_acronym_mapping_ai():
     """Test mapping for Artificial Intelligence -> AI."""
     result = find_acronym_mapping("Artificial Intelligence", "AI")
@@ -69,10 +108,156 @@ def test_find_acronym_mapping_returns_valid_transport():
     assert np.all(transport >= 0)
 
 
+def test_find_acronym_mapping_empty():
+    """Test that an empty phrase or acronym gives an empty transport plan."""
+    result = find_acronym_mapping("Hello World", "")
+    assert result["transport_plan"].shape == (2, 0)
+    assert result["mappings"] == []
+
+    result = find_acronym_mapping("", "AB")
+    assert result["transport_plan"].shape == (0, 2)
+    assert result["mappings"] == []
+
+
+def test_find_acronym_mapping_fast_path():
+    """Test that an exact acronym skips the solver with a diagonal plan."""
+    result = find_acronym_mapping("Machine Learning", "ml", fast_path=True)
+    assert np.allclose(result["transport_plan"], np.eye(2) / 2)
+
+    result = find_acronym_mapping("Machine Learning", "ml")
+    transport = result["transport_plan"]
+    assert transport[0, 0] > transport[0, 1]
+    assert not np.allclose(transport, np.eye(2) / 2)
+
+
+def test_find_acronym_mapping_small_reg():
+    """Test that a small regularization still gives a finite, diagonal plan."""
+    result = find_acronym_mapping("Random Access Memory", "RAM", reg=0.01, reg_m=0.1)
+
+    transport = result["transport_plan"]
+    assert np.all(np.isfinite(transport))
+    assert np.all(np.diag(transport) > 0.1)
+
+    # 'M' matches nothing in "RAX", which made the stabilized solver diverge
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", UserWarning)
+        result = find_acronym_mapping("Random Access Memory", "RAX", reg=0.01)
+
+    transport = result["transport_plan"]
+    assert np.all(np.isfinite(transport))
+    assert transport[0, 0] > 0.3
+    assert transport[1, 1] > 0.3
+    assert transport[2].sum() < 1e-3
+
+
+def test_find_acronym_mapping_dtype():
+    """Test that the floating point type of the transport plan can be chosen."""
+    result = find_acronym_mapping("Machine Learning", "ML")
+    assert result["transport_plan"].dtype == np.float64
+
+    result = find_acronym_mapping("Machine Learning", "ML", dtype=np.float32)
+    assert result["transport_plan"].dtype == np.float32
+
+    # The default precision keeps the kernel exp(-1 / reg) out of underflow
+    result = find_acronym_mapping("Random Access Memory", "RAX", reg=0.01)
+    assert result["transport_plan"].max() > 0.3
+
+
+def test_find_acronym_mappings_matches_single():
+    """Test that the batched solve matches solving each pair separately."""
+    pairs = [
+        ("Artificial Intelligence", "AI"),
+        ("Natural Language Processing", "NLP"),
+        ("Random Access Memory", "RAM"),
+    ]
+    results = find_acronym_mappings(pairs)
+
+    assert len(results) == len(pairs)
+    for (phrase, acronym), result in zip(pairs, results):
+        expected = find_acronym_mapping(phrase, acronym)
+        assert result["phrase"] == phrase
+        assert result["source_chars"] == expected["source_chars"]
+        assert result["transport_plan"].shape == expected["transport_plan"].shape
+        assert np.allclose(
+            result["transport_plan"], expected["transport_plan"], atol=1e-4
+        )
+
+
+def test_find_acronym_mappings_no_warnings():
+    """Test that the infinite off-block cost does not emit runtime warnings."""
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", RuntimeWarning)
+        results = find_acronym_mappings(
+            [("Machine Learning", "ML"), ("Random Access Memory", "RAM")]
+        )
+
+    assert len(results) == 2
+
+
+def test_find_acronym_mappings_empty():
+    """Test that an empty batch gives no results."""
+    assert find_acronym_mappings([]) == []
+
+
+def test_find_acronym_mappings_empty_pair():
+    """Test that a pair with an empty side does not affect the other pairs."""
+    for empty_pair in [("Hello World", ""), ("", "AB")]:
+        results = find_acronym_mappings([empty_pair, ("Machine Learning", "ML")])
+
+        empty = results[0]["transport_plan"]
+        assert empty.shape == (len(empty_pair[0].split()), len(empty_pair[1]))
+
+        expected = find_acronym_mapping("Machine Learning", "ML")
+        assert np.allclose(
+            results[1]["transport_plan"], expected["transport_plan"], atol=1e-4
+        )
+
+
+def test_find_acronym_mappings_mixed_ascii():
+    """Test that a non-ASCII pair does not change the plans of other pairs."""
+    pairs = [("Artificial Intelligence", "AI"), ("Ärger Uber", "AU")]
+    results = find_acronym_mappings(pairs)
+
+    for (phrase, acronym), result in zip(pairs, results):
+        expected = find_acronym_mapping(phrase, acronym)
+        assert np.allclose(
+            result["transport_plan"], expected["transport_plan"], atol=1e-4
+        )
+
+    transport = results[0]["transport_plan"]
+    assert transport[0, 0] > transport[0, 1]
+    assert transport[1, 1] > transport[1, 0]
+
+
+def test_sweep_reg_m_matches_single():
+    """Test that the reg_m sweep matches solving each value separately."""
+    reg_m_values = [0.1, 1.0, 5.0]
+    results = sweep_reg_m("Machine Learning", "ML", reg_m_values)
+
+    assert len(results) == len(reg_m_values)
+    for reg_m, result in zip(reg_m_values, results):
+        expected = find_acronym_mapping("Machine Learning", "ML", reg_m=reg_m)
+        assert np.allclose(
+            result["transport_plan"], expected["transport_plan"], atol=1e-4
+        )
+
+
 if __name__ == "__main__":
     test_character_position_cost_matching()
     test_character_position_cost_case_insensitive()
+    test_character_position_cost_mixed_ascii()
+    test_character_position_cost_long_input()
     test_find_acronym_mapping_ai()
     test_find_acronym_mapping_nlp()
     test_find_acronym_mapping_returns_valid_transport()
+    test_find_acronym_mapping_empty()
+    test_find_acronym_mapping_fast_path()
+    test_find_acronym_mapping_small_reg()
+    test_find_acronym_mapping_dtype()
+    test_find_acronym_mappings_matches_single()
+    test_find_acronym_mappings_no_warnings()
+    test_find_acronym_mappings_empty()
+    test_find_acronym_mappings_empty_pair()
+    test_find_acronym_mappings_mixed_ascii()
+    test_sweep_reg_m_matches_single()
     print("All tests passed!")